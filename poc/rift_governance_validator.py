@@ -5,28 +5,101 @@ OBINexus AEGIS Methodology Compliance
 Systematic validation of gov.substage.stage.riftrc.{N} configurations
 """
 
+import asyncio
+import contextlib
+import functools
 import json
 import hashlib
 import datetime
 import subprocess
 import os
+import sys
+import itertools
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from enum import Enum
+from types import MappingProxyType
+
+# orjson is an optional C accelerator; stdlib json accepts the same bytes input
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# ciso8601 is an optional C ISO-8601 parser; fromisoformat handles the 'Z' suffix via replace
+try:
+    from ciso8601 import parse_datetime as _parse_timestamp
+except ImportError:
+    def _parse_timestamp(timestamp_str: str) -> datetime.datetime:
+        return datetime.datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+
+# Shared deadline (seconds) for a round of NLink SemVerX checks
+_NLINK_TIMEOUT = 30
+
+# Parsed governance documents persisted between runs, keyed by path/mtime/size
+_PARSE_CACHE_NAME = ".riftrc.cache.json"
 
 class StageType(Enum):
     LEGACY = "legacy"
     EXPERIMENTAL = "experimental" 
     STABLE = "stable"
 
+_STAGE_TYPE_MAP = {stage_type.value: stage_type for stage_type in StageType}
+
 class ValidationResult(Enum):
     VALID = "valid"
     EXPIRED = "expired"
     INVALID_SCHEMA = "invalid_schema"
     SEMVERX_VIOLATION = "semverx_violation"
     MISSING_GOVERNANCE = "missing_governance"
+    SKIPPED = "skipped"
+
+# Results that halt the build
+_CRITICAL_RESULTS = frozenset({ValidationResult.SEMVERX_VIOLATION, ValidationResult.EXPIRED})
 
-@dataclass
+# Required security validations for Stage 5
+_STAGE5_REQUIRED_FIELDS = frozenset({"optimizer_model", "minimization_verified", "audit_enabled"})
+
+# Severity ranking for overall status reduction (higher is worse)
+_RESULT_SEVERITY = {
+    ValidationResult.VALID: 0,
+    ValidationResult.SKIPPED: 0,
+    ValidationResult.INVALID_SCHEMA: 1,
+    ValidationResult.MISSING_GOVERNANCE: 2,
+    ValidationResult.EXPIRED: 3,
+    ValidationResult.SEMVERX_VIOLATION: 4,
+}
+_STATUS_BY_SEVERITY = (
+    "COMPLIANT",
+    "SCHEMA_VIOLATIONS",
+    "MISSING_GOVERNANCE",
+    "EXPIRED_GOVERNANCE",
+    "CRITICAL_FAILURE",
+)
+
+# Standard substages mapping
+_SUBSTAGE_MAPPING = MappingProxyType({
+    0: ("tokenizer",),
+    1: ("parser",),
+    2: ("semantic",),
+    3: ("validator",),
+    4: ("bytecode",),
+    5: ("optimizer", "verifier"),  # Stage 5 includes security optimization
+    6: ("emitter",)
+})
+
+@dataclass(slots=True, frozen=True)
 class GovernanceConfig:
     package_name: str
     version: str
@@ -36,7 +109,18 @@ class GovernanceConfig:
     semverx_lock: bool
     entry_point: str
     nlink_enabled: bool
-    custom_stages: List[Dict] = None
+    custom_stages: Tuple[Dict, ...] = ()
+
+def _entry_point(method):
+    """
+    Public entry point: directory listings are rescanned when the outermost call starts,
+    and buffered validation log entries are written to the console when it returns
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._entry_scope():
+            return method(self, *args, **kwargs)
+    return wrapper
 
 class RIFTGovernanceValidator:
     """
@@ -47,97 +131,215 @@ class RIFTGovernanceValidator:
     def __init__(self, project_root: str):
         self.project_root = project_root
         self.governance_cache = {}
-        self.validation_log = []
+        self._audit_fingerprints: Dict[str, str] = {}  # path -> SHA-256 of artifacts used by this report
+        self.validation_log = deque(maxlen=10000)
+        self._log_buffer = deque(maxlen=10000)  # Entries not yet written to the console
+        self._entry_depth = 0  # Nesting of public entry points; the outermost one rescans and flushes
+        self._fs_index: Dict[str, Dict[str, os.DirEntry]] = {}
+        self._log_lock = threading.Lock()
+        self._defer_semverx = False
+        # (stage_id, result_key, (package, version)) for results awaiting the batched SemVerX check
+        self._semverx_sites: List[Tuple[int, str, Tuple[str, str]]] = []
+        self._now: Optional[datetime.datetime] = None
+        self._stage_paths: Dict[int, Tuple[Tuple[str, str], Dict[str, Tuple[str, str, str]]]] = {}
+        self._parse_cache_path = os.path.join(project_root, _PARSE_CACHE_NAME)
+        self._parse_cache: Dict[str, Dict] = self._load_parse_cache()
+        self._parse_cache_dirty = False
         
-    def validate_governance_file(self, governance_path: str) -> Tuple[ValidationResult, GovernanceConfig]:
+    @_entry_point
+    def validate_governance_file(self, governance_path: str,
+                                 entry: Optional[os.DirEntry] = None) -> Tuple[ValidationResult, GovernanceConfig]:
         """
         Validates individual governance configuration file
         Returns validation result and parsed config if valid
+        Parsed configs are memoized per (path, mtime); freshness and SemVerX checks
+        depend on the clock and NLink, so they run on every call
+        A DirEntry from the directory index, when given, supplies the cached stat
         """
         try:
-            with open(governance_path, 'r') as f:
-                config_data = json.load(f)
-            
-            # Schema validation
-            if not self._validate_required_fields(config_data):
-                return ValidationResult.INVALID_SCHEMA, None
-            
-            config = self._parse_governance_config(config_data)
-            
-            # Timestamp freshness check
-            if not self._validate_timestamp_freshness(config.timestamp):
-                return ValidationResult.EXPIRED, config
-            
-            # SemVerX lock enforcement
-            if config.semverx_lock and not self._validate_semverx_compliance(config):
-                return ValidationResult.SEMVERX_VIOLATION, config
-            
-            return ValidationResult.VALID, config
-            
-        except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
+            abs_path = os.path.abspath(governance_path)
+            file_stat = entry.stat(follow_symlinks=False) if entry is not None else os.stat(governance_path)
+        except OSError as e:
             self._log_validation_error(f"Governance file validation failed: {e}")
             return ValidationResult.INVALID_SCHEMA, None
+        
+        cache_key = (abs_path, file_stat.st_mtime_ns)
+        parsed = self.governance_cache.get(cache_key)
+        if parsed is None:
+            parsed = self._parse_governance_file(governance_path, abs_path, file_stat)
+            self.governance_cache[cache_key] = parsed
+        
+        config, digest = parsed
+        if digest is not None:
+            self._audit_fingerprints[abs_path] = digest
+        if config is None:
+            return ValidationResult.INVALID_SCHEMA, None
+        
+        # Timestamp freshness check
+        if not self._validate_timestamp_freshness(config.timestamp, self._now):
+            return ValidationResult.EXPIRED, config
+        
+        # SemVerX lock enforcement
+        if config.semverx_lock and not self._validate_semverx_compliance(config):
+            return ValidationResult.SEMVERX_VIOLATION, config
+        
+        return ValidationResult.VALID, config
+    
+    def _parse_governance_file(self, governance_path: str, abs_path: str,
+                               file_stat: os.stat_result) -> Tuple[Optional[GovernanceConfig], Optional[str]]:
+        """
+        Parses a governance file into (GovernanceConfig, SHA-256 digest)
+        The config is None if the file violates the schema; the digest is None if it could not be read
+        """
+        try:
+            config_data, digest = self._load_governance_data(governance_path, abs_path, file_stat)
+        except (json.JSONDecodeError, FileNotFoundError) as e:
+            self._log_validation_error(f"Governance file validation failed: {e}")
+            return None, None
+        
+        # Schema validation - required fields are enforced by the parse itself
+        try:
+            return self._parse_governance_config(config_data), digest
+        except (KeyError, TypeError):
+            return None, digest
+    
+    def _load_governance_data(self, governance_path: str, abs_path: str,
+                              file_stat: os.stat_result) -> Tuple[Dict, str]:
+        """
+        Returns the parsed governance document and its SHA-256 digest,
+        skipping the read and parse if unchanged since last run
+        """
+        entry = self._parse_cache.get(abs_path)
+        if (entry is not None and entry.get("mtime_ns") == file_stat.st_mtime_ns
+                and entry.get("size") == file_stat.st_size and "sha256" in entry):
+            return entry["data"], entry["sha256"]
+        
+        with open(governance_path, 'rb') as f:
+            raw = f.read()
+        # Hash the bytes already in memory rather than reading the file a second time
+        digest = hashlib.sha256(raw).hexdigest()
+        config_data = _json_loads(raw)
+        self._parse_cache[abs_path] = {
+            "mtime_ns": file_stat.st_mtime_ns,
+            "size": file_stat.st_size,
+            "sha256": digest,
+            "data": config_data
+        }
+        self._parse_cache_dirty = True
+        return config_data, digest
+    
+    def _load_parse_cache(self) -> Dict[str, Dict]:
+        """Loads the persisted parse cache, discarding it if unreadable"""
+        try:
+            with open(self._parse_cache_path, 'rb') as f:
+                parse_cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(parse_cache, dict):
+            return {}
+        # Malformed entries are dropped and simply re-parsed
+        return {path: entry for path, entry in parse_cache.items()
+                if isinstance(entry, dict) and "data" in entry}
     
+    def _save_parse_cache(self):
+        """Atomically persists the parse cache (tempfile + rename)"""
+        if not self._parse_cache_dirty:
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.project_root, prefix=_PARSE_CACHE_NAME)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_json_dumps(self._parse_cache))
+                os.replace(tmp_path, self._parse_cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self._log_validation_error(f"Governance parse cache not saved: {e}")
+            return
+        self._parse_cache_dirty = False
+    
+    @_entry_point
     def validate_stage_governance(self, stage_id: int) -> Dict[str, ValidationResult]:
         """
         Validates all substage governance files for a given compiler stage
         """
         results = {}
-        
-        # Standard substages mapping
-        substage_mapping = {
-            0: ["tokenizer"],
-            1: ["parser"], 
-            2: ["semantic"],
-            3: ["validator"],
-            4: ["bytecode"],
-            5: ["optimizer", "verifier"],  # Stage 5 includes security optimization
-            6: ["emitter"]
-        }
+        critical_seen = False  # Any build-halting result recorded for this stage so far
+        (primary_name, primary_path), substage_paths = self._get_stage_paths(stage_id)
         
         # Validate primary stage governance
-        primary_config_path = f"{self.project_root}/.riftrc.{stage_id}"
-        if os.path.exists(primary_config_path):
-            result, config = self.validate_governance_file(primary_config_path)
+        primary_entry = self._governance_entry(primary_name)
+        if primary_entry is not None:
+            result, config = self.validate_governance_file(primary_path, primary_entry)
             results[f"stage_{stage_id}_primary"] = result
+            self._track_deferred_semverx(stage_id, f"stage_{stage_id}_primary", result, config)
+            critical_seen = result in _CRITICAL_RESULTS
         
         # Validate substage governance files
-        if stage_id in substage_mapping:
-            for substage in substage_mapping[stage_id]:
-                gov_path = f"{self.project_root}/gov.{substage}.stage.riftrc.{stage_id}"
-                if os.path.exists(gov_path):
-                    result, config = self.validate_governance_file(gov_path)
+        if substage_paths:
+            for substage, (gov_name, gov_path, _) in substage_paths.items():
+                gov_entry = self._governance_entry(gov_name)
+                if gov_entry is not None:
+                    result, config = self.validate_governance_file(gov_path, gov_entry)
                     results[f"{substage}_governance"] = result
+                    self._track_deferred_semverx(stage_id, f"{substage}_governance", result, config)
+                    critical_seen = critical_seen or result in _CRITICAL_RESULTS
                     
-                    # Stage 5 optimizer security validation
+                    # Stage 5 optimizer security validation - pointless once the stage halts the build
                     if stage_id == 5 and substage == "optimizer":
-                        security_result = self._validate_stage5_security_governance(config)
-                        results["optimizer_security"] = security_result
+                        if critical_seen:
+                            results["optimizer_security"] = ValidationResult.SKIPPED
+                        else:
+                            results["optimizer_security"] = self._validate_stage5_security_governance(config)
                 else:
                     # Missing governance file - check if fallback exists
                     fallback_result = self._handle_missing_governance(stage_id, substage)
                     results[f"{substage}_fallback"] = fallback_result
+                    critical_seen = critical_seen or fallback_result in _CRITICAL_RESULTS
         
         return results
     
+    @_entry_point
     def validate_complete_pipeline(self) -> Dict[int, Dict[str, ValidationResult]]:
         """
         Validates governance across all RIFT pipeline stages (0-6)
+        Stages are I/O bound and independent, so they are validated concurrently
+        SemVerX checks are deferred and resolved with a single batched NLink call
         """
-        pipeline_results = {}
+        self._defer_semverx = True
+        try:
+            pipeline_results = self._validate_stages(range(7))  # Stages 0-6
+        finally:
+            self._defer_semverx = False
+            sites, self._semverx_sites = self._semverx_sites, []
         
-        for stage_id in range(7):  # Stages 0-6
-            stage_results = self.validate_stage_governance(stage_id)
-            pipeline_results[stage_id] = stage_results
-            
+        # Patch provisional VALID results for packages the batch found non-compliant
+        violations = self._flush_semverx(list(dict.fromkeys(package for _, _, package in sites)))
+        for stage_id, result_key, package in sites:
+            if package in violations:
+                stage_results = pipeline_results[stage_id]
+                stage_results[result_key] = ValidationResult.SEMVERX_VIOLATION
+                # As in validate_stage_governance, optimizer security is not evaluated once stage 5 halts
+                if result_key in ("stage_5_primary", "optimizer_governance") and "optimizer_security" in stage_results:
+                    stage_results["optimizer_security"] = ValidationResult.SKIPPED
+        
+        for stage_id, stage_results in pipeline_results.items():
             # Critical failure check
-            if any(result in [ValidationResult.SEMVERX_VIOLATION, ValidationResult.EXPIRED] 
-                   for result in stage_results.values()):
+            if any(result in _CRITICAL_RESULTS for result in stage_results.values()):
                 self._trigger_build_halt(stage_id, stage_results)
         
         return pipeline_results
     
-    def validate_custom_stages(self, custom_stage_configs: List[Dict]) -> Dict[str, ValidationResult]:
+    def _validate_stages(self, stage_ids: range) -> Dict[int, Dict[str, ValidationResult]]:
+        """Runs validate_stage_governance for each stage on a thread pool"""
+        with ThreadPoolExecutor(max_workers=len(stage_ids)) as executor:
+            futures = {stage_id: executor.submit(self.validate_stage_governance, stage_id)
+                       for stage_id in stage_ids}
+            return {stage_id: future.result() for stage_id, future in futures.items()}
+    
+    @_entry_point
+    def validate_custom_stages(self, custom_stage_configs: Sequence[Dict]) -> Dict[str, ValidationResult]:
         """
         Validates user-defined custom stages (backlog, preprod, chaos, etc.)
         """
@@ -152,9 +354,11 @@ class RIFTGovernanceValidator:
                 continue
             
             # Check for governance file
-            custom_gov_path = f"{self.project_root}/gov.{stage_name}.stage.riftrc.custom"
-            if os.path.exists(custom_gov_path):
-                result, config = self.validate_governance_file(custom_gov_path)
+            custom_gov_name = f"gov.{stage_name}.stage.riftrc.custom"
+            custom_gov_entry = self._governance_entry(custom_gov_name)
+            if custom_gov_entry is not None:
+                result, config = self.validate_governance_file(f"{self.project_root}/{custom_gov_name}",
+                                                               custom_gov_entry)
                 results[f"custom_{stage_name}"] = result
             else:
                 # Custom stages can be optional if not activated
@@ -170,16 +374,13 @@ class RIFTGovernanceValidator:
         Stage 5 Optimizer Security Governance Enforcement
         Validates AST minimization and path sanitization compliance
         """
-        if not hasattr(config, 'stage_5_optimizer'):
+        optimizer_config = getattr(config, 'stage_5_optimizer', None)
+        if optimizer_config is None:
             return ValidationResult.MISSING_GOVERNANCE
         
-        optimizer_config = getattr(config, 'stage_5_optimizer', {})
-        
         # Required security validations for Stage 5
-        required_fields = ["optimizer_model", "minimization_verified", "audit_enabled"]
-        for field in required_fields:
-            if field not in optimizer_config:
-                return ValidationResult.INVALID_SCHEMA
+        if not _STAGE5_REQUIRED_FIELDS.issubset(optimizer_config):
+            return ValidationResult.INVALID_SCHEMA
         
         # Verify minimization was actually performed
         if not optimizer_config.get("minimization_verified", False):
@@ -187,41 +388,45 @@ class RIFTGovernanceValidator:
         
         # Check for audit trail
         if optimizer_config.get("audit_enabled", True):
-            audit_path = f"{self.project_root}/logs/opt_trace.sig"
-            if not os.path.exists(audit_path):
+            if self._governance_entry("opt_trace.sig", "logs") is None:
                 return ValidationResult.MISSING_GOVERNANCE
         
         return ValidationResult.VALID
     
-    def _validate_required_fields(self, config_data: Dict) -> bool:
-        """Validates required fields are present in governance config"""
-        required_fields = ["package_name", "version", "stage", "timestamp"]
-        return all(field in config_data for field in required_fields)
-    
     def _parse_governance_config(self, config_data: Dict) -> GovernanceConfig:
-        """Parses JSON config data into GovernanceConfig object"""
+        """
+        Parses JSON config data into GovernanceConfig object
+        Raises KeyError/TypeError when required fields (package_name, version,
+        stage, timestamp) are missing, stage_type is unknown, or the document
+        is not an object
+        """
         return GovernanceConfig(
             package_name=config_data["package_name"],
             version=config_data["version"],
             timestamp=config_data["timestamp"],
             stage=config_data["stage"],
-            stage_type=StageType(config_data.get("stage_type", "experimental")),
+            stage_type=_STAGE_TYPE_MAP[config_data.get("stage_type", "experimental")],
             semverx_lock=config_data.get("semverx_lock", False),
             entry_point=config_data.get("entry_point", ""),
             nlink_enabled=config_data.get("nlink_enabled", False),
-            custom_stages=config_data.get("custom_stages", [])
+            custom_stages=tuple(config_data.get("custom_stages", ()))
         )
     
-    def _validate_timestamp_freshness(self, timestamp_str: str) -> bool:
-        """Validates timestamp hasn't expired (configurable expiration window)"""
+    def _validate_timestamp_freshness(self, timestamp_str: str,
+                                      now: Optional[datetime.datetime] = None) -> bool:
+        """
+        Validates timestamp hasn't expired (configurable expiration window)
+        Future-dated timestamps are rejected so they cannot bypass expiry
+        Callers validating many files pass a shared `now` to avoid re-reading the clock
+        """
         try:
-            config_timestamp = datetime.datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            current_time = datetime.datetime.now(datetime.timezone.utc)
+            config_timestamp = _parse_timestamp(timestamp_str)
+            current_time = now or datetime.datetime.now(datetime.timezone.utc)
             
             # 90-day expiration window for governance configs
             expiration_window = datetime.timedelta(days=90)
             
-            return (current_time - config_timestamp) < expiration_window
+            return datetime.timedelta(0) <= (current_time - config_timestamp) < expiration_window
         except ValueError:
             return False
     
@@ -230,49 +435,183 @@ class RIFTGovernanceValidator:
         if not config.nlink_enabled:
             return True  # Skip if NLink not enabled
         
+        if self._defer_semverx:
+            # Provisionally compliant - the caller records the result via _track_deferred_semverx
+            return True
+        
         # Execute NLink validation
+        compliance = self._check_semverx_compliance([(config.package_name, config.version)])
+        return compliance[f"{config.package_name}@{config.version}"]
+    
+    def _check_semverx_compliance(self, pending: List[Tuple[str, str]]) -> Dict[str, bool]:
+        """
+        Validates (package, version) pairs per package under one shared deadline
+        Checks overlap on a private event loop; callers already inside an event loop
+        cannot start one, so they fall back to sequential blocking checks
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._gather_semverx_compliance(pending))
+        
+        deadline = time.monotonic() + _NLINK_TIMEOUT
+        compliance = {}
+        for package, version in pending:
+            try:
+                result = subprocess.run([
+                    "nlink", "--semverx-validate",
+                    "--project-root", self.project_root,
+                    "--package", package,
+                    "--version", version
+                ], capture_output=True, timeout=max(deadline - time.monotonic(), 0))
+                compliance[f"{package}@{version}"] = result.returncode == 0
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                self._log_validation_error("NLink validation failed - treating as non-compliant")
+                compliance[f"{package}@{version}"] = False
+        return compliance
+    
+    async def _validate_semverx_compliance_async(self, package_name: str, version: str) -> bool:
+        """Runs a single NLink SemVerX validation without blocking the event loop"""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "nlink", "--semverx-validate",
+                "--project-root", self.project_root,
+                "--package", package_name,
+                "--version", version,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        except FileNotFoundError:
+            self._log_validation_error("NLink validation failed - treating as non-compliant")
+            return False
+        
+        try:
+            return await process.wait() == 0
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+    
+    async def _gather_semverx_compliance(self, pending: List[Tuple[str, str]]) -> Dict[str, bool]:
+        """
+        Validates (package, version) pairs concurrently under one shared deadline
+        Returns {"<package>@<version>": compliant}; checks cut off by the deadline are non-compliant
+        """
+        tasks = [asyncio.ensure_future(self._validate_semverx_compliance_async(package, version))
+                 for package, version in pending]
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks), timeout=_NLINK_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._log_validation_error("NLink validation failed - treating as non-compliant")
+        
+        return {f"{package}@{version}": task.done() and not task.cancelled() and task.result()
+                for (package, version), task in zip(pending, tasks)}
+    
+    def _track_deferred_semverx(self, stage_id: int, result_key: str,
+                                result: ValidationResult, config: Optional[GovernanceConfig]):
+        """Records a result whose SemVerX check was deferred so the pipeline can patch it"""
+        if (self._defer_semverx and result == ValidationResult.VALID
+                and config.semverx_lock and config.nlink_enabled):
+            self._semverx_sites.append((stage_id, result_key, (config.package_name, config.version)))
+    
+    def _flush_semverx(self, pending: List[Tuple[str, str]]) -> set:
+        """
+        Validates deferred SemVerX locks with one NLink batch invocation
+        Returns the set of non-compliant (package, version) pairs
+        """
+        if not pending:
+            return set()
+        
+        compliance = {}
         try:
             result = subprocess.run([
-                "nlink", "--semverx-validate", 
+                "nlink", "--semverx-validate-batch",
                 "--project-root", self.project_root,
-                "--package", config.package_name,
-                "--version", config.version
-            ], capture_output=True, text=True, timeout=30)
+                "--json"
+            ], input=json.dumps(pending), capture_output=True, text=True, timeout=_NLINK_TIMEOUT)
             
-            return result.returncode == 0
+            # Expected output: {"<package>@<version>": true|false, ...}
+            compliance = json.loads(result.stdout)
+            if not isinstance(compliance, dict):
+                raise json.JSONDecodeError("expected a JSON object", result.stdout, 0)
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            self._log_validation_error("NLink validation failed - treating as non-compliant")
-            return False
+            self._log_validation_error("NLink batch validation failed - treating as non-compliant")
+        except json.JSONDecodeError:
+            # NLink without batch support - overlap per-package checks under one deadline instead
+            compliance = self._check_semverx_compliance(pending)
+        
+        return {(package, version) for package, version in pending
+                if compliance.get(f"{package}@{version}") is not True}
     
     def _handle_missing_governance(self, stage_id: int, substage: str) -> ValidationResult:
         """
         Handles missing governance files with fallback logic
         """
+        (primary_name, primary_path), substage_paths = self._get_stage_paths(stage_id)
+        
         # Check for fallback governance in irift/ directory
-        fallback_path = f"{self.project_root}/irift/gov.{substage}.stage.riftrc.{stage_id}"
-        if os.path.exists(fallback_path):
-            result, config = self.validate_governance_file(fallback_path)
+        fallback_name, _, fallback_path = substage_paths[substage]
+        fallback_entry = self._governance_entry(fallback_name, "irift")
+        if fallback_entry is not None:
+            result, config = self.validate_governance_file(fallback_path, fallback_entry)
+            self._track_deferred_semverx(stage_id, f"{substage}_fallback", result, config)
             self._log_validation_error(f"Using fallback governance for {substage} stage {stage_id}")
             return result
         
         # No fallback available - check if stage is experimental
-        primary_config_path = f"{self.project_root}/.riftrc.{stage_id}"
-        if os.path.exists(primary_config_path):
-            with open(primary_config_path, 'r') as f:
-                primary_config = json.load(f)
+        primary_entry = self._governance_entry(primary_name)
+        if primary_entry is not None:
+            # Only an explicit stage_type counts; the parsed config defaults it to experimental
+            try:
+                primary_data, _ = self._load_governance_data(primary_path, os.path.abspath(primary_path),
+                                                             primary_entry.stat(follow_symlinks=False))
+            except (json.JSONDecodeError, OSError):
+                return ValidationResult.MISSING_GOVERNANCE
             
-            if primary_config.get("stage_type") == "experimental":
+            if isinstance(primary_data, dict) and primary_data.get("stage_type") == "experimental":
                 # Experimental stages can operate without full governance
                 return ValidationResult.VALID
         
         return ValidationResult.MISSING_GOVERNANCE
     
+    def _get_stage_paths(self, stage_id: int) -> Tuple[Tuple[str, str], Dict[str, Tuple[str, str, str]]]:
+        """
+        Returns the cached governance file names/paths for a stage
+        ((primary_name, primary_path), {substage: (gov_name, gov_path, fallback_path)})
+        """
+        stage_paths = self._stage_paths.get(stage_id)
+        if stage_paths is None:
+            primary_name = f".riftrc.{stage_id}"
+            substage_paths = {}
+            for substage in _SUBSTAGE_MAPPING.get(stage_id, ()):
+                gov_name = f"gov.{substage}.stage.riftrc.{stage_id}"
+                substage_paths[substage] = (gov_name,
+                                            f"{self.project_root}/{gov_name}",
+                                            f"{self.project_root}/irift/{gov_name}")
+            stage_paths = ((primary_name, f"{self.project_root}/{primary_name}"), substage_paths)
+            self._stage_paths[stage_id] = stage_paths
+        return stage_paths
+    
+    def _governance_entry(self, name: str, subdir: str = "") -> Optional[os.DirEntry]:
+        """
+        Looks up a governance artifact in a cached directory listing
+        Each directory is scanned once per top-level call instead of stat()ing every candidate path;
+        only regular files count, using the d_type scandir already returned (symlinks are skipped)
+        """
+        entries = self._fs_index.get(subdir)
+        if entries is None:
+            try:
+                with os.scandir(os.path.join(self.project_root, subdir)) as scan:
+                    entries = {entry.name: entry for entry in scan if entry.is_file(follow_symlinks=False)}
+            except OSError:
+                entries = {}
+            self._fs_index[subdir] = entries
+        return entries.get(name)
+    
     def _trigger_build_halt(self, stage_id: int, stage_results: Dict[str, ValidationResult]):
         """
         Triggers build halt on critical governance violations
         """
-        critical_failures = [res for res in stage_results.values() 
-                           if res in [ValidationResult.SEMVERX_VIOLATION, ValidationResult.EXPIRED]]
+        critical_failures = [res for res in stage_results.values() if res in _CRITICAL_RESULTS]
         
         if critical_failures:
             halt_message = f"AEGIS BUILD HALT: Stage {stage_id} governance violation detected"
@@ -283,59 +622,117 @@ class RIFTGovernanceValidator:
         """Logs validation errors for audit trail"""
         timestamp = datetime.datetime.now().isoformat()
         log_entry = f"[{timestamp}] GOVERNANCE_VALIDATION: {message}"
-        self.validation_log.append(log_entry)
-        print(log_entry)  # Also output to console
+        with self._log_lock:  # Stage workers may log concurrently
+            self.validation_log.append(log_entry)
+            self._log_buffer.append(log_entry)  # Console output is deferred to _flush_log
+    
+    @contextlib.contextmanager
+    def _entry_scope(self):
+        """Tracks nested public calls; stage workers run inside the pipeline's scope"""
+        with self._log_lock:
+            self._entry_depth += 1
+            if self._entry_depth == 1:
+                # Each top-level call sees the current directory contents and file stats
+                self._fs_index.clear()
+        try:
+            yield
+        finally:
+            with self._log_lock:
+                self._entry_depth -= 1
+                outermost = self._entry_depth == 0
+            if outermost:
+                self._flush_log()
+    
+    def _flush_log(self):
+        """Writes buffered validation log entries to the console in one write"""
+        with self._log_lock:
+            if not self._log_buffer:
+                return
+            pending = "\n".join(self._log_buffer) + "\n"
+            self._log_buffer.clear()
+        sys.stdout.write(pending)
+        sys.stdout.flush()
     
+    @_entry_point
     def generate_governance_report(self) -> Dict:
         """
         Generates comprehensive governance validation report
         """
-        pipeline_results = self.validate_complete_pipeline()
-        
-        # Load and validate custom stages if they exist
-        custom_results = {}
-        main_config_path = f"{self.project_root}/.riftrc"
-        if os.path.exists(main_config_path):
-            with open(main_config_path, 'r') as f:
-                main_config = json.load(f)
-            custom_stages = main_config.get("custom_stages", [])
-            custom_results = self.validate_custom_stages(custom_stages)
+        # Drop audited artifacts from any previous report
+        self._audit_fingerprints.clear()
+        # Single reference time for every freshness check in this report
+        self._now = datetime.datetime.now(datetime.timezone.utc)
+        try:
+            pipeline_results = self.validate_complete_pipeline()
+            
+            # Load and validate custom stages if they exist
+            custom_results = {}
+            main_config_path = f"{self.project_root}/.riftrc"
+            main_config_entry = self._governance_entry(".riftrc")
+            if main_config_entry is not None:
+                # .riftrc only lists custom stages; it is not itself a governance config
+                try:
+                    main_config, _ = self._load_governance_data(main_config_path, os.path.abspath(main_config_path),
+                                                                main_config_entry.stat(follow_symlinks=False))
+                except (json.JSONDecodeError, OSError) as e:
+                    self._log_validation_error(f"Main configuration unreadable: {e}")
+                    main_config = {}
+                custom_stages = main_config.get("custom_stages", []) if isinstance(main_config, dict) else []
+                custom_results = self.validate_custom_stages(custom_stages)
+        finally:
+            self._now = None
+            self._save_parse_cache()
         
         return {
             "timestamp": datetime.datetime.now().isoformat(),
             "project_root": self.project_root,
             "pipeline_validation": pipeline_results,
             "custom_stage_validation": custom_results,
-            "validation_log": self.validation_log,
+            "validation_log": list(self.validation_log),
+            "audit_fingerprints": dict(self._audit_fingerprints),
             "overall_status": self._determine_overall_status(pipeline_results, custom_results)
         }
     
     def _determine_overall_status(self, pipeline_results: Dict, custom_results: Dict) -> str:
-        """Determines overall validation status"""
-        all_results = []
-        
-        for stage_results in pipeline_results.values():
-            all_results.extend(stage_results.values())
-        all_results.extend(custom_results.values())
-        
-        if any(result == ValidationResult.SEMVERX_VIOLATION for result in all_results):
-            return "CRITICAL_FAILURE"
-        elif any(result == ValidationResult.EXPIRED for result in all_results):
-            return "EXPIRED_GOVERNANCE"
-        elif any(result == ValidationResult.MISSING_GOVERNANCE for result in all_results):
-            return "MISSING_GOVERNANCE"
-        elif any(result == ValidationResult.INVALID_SCHEMA for result in all_results):
-            return "SCHEMA_VIOLATIONS"
-        else:
-            return "COMPLIANT"
+        """Determines overall validation status from the single worst result"""
+        all_results = itertools.chain(
+            itertools.chain.from_iterable(stage_results.values() for stage_results in pipeline_results.values()),
+            custom_results.values()
+        )
+        worst = max((_RESULT_SEVERITY[result] for result in all_results), default=0)
+        return _STATUS_BY_SEVERITY[worst]
+
+
+def format_governance_report(report: Dict) -> str:
+    """
+    Renders a governance report as console text
+    """
+    lines = [
+        "",
+        "="*60,
+        "RIFT GOVERNANCE VALIDATION REPORT",
+        "="*60,
+        f"Project: {report['project_root']}",
+        f"Timestamp: {report['timestamp']}",
+        f"Overall Status: {report['overall_status']}",
+    ]
+    
+    # Detailed results
+    for stage_id, results in report['pipeline_validation'].items():
+        lines.append(f"\nStage {stage_id} Results:")
+        lines.extend(f"  {component}: {result.value}" for component, result in results.items())
+    
+    if report['custom_stage_validation']:
+        lines.append("\nCustom Stage Results:")
+        lines.extend(f"  {stage}: {result.value}" for stage, result in report['custom_stage_validation'].items())
+    
+    return "\n".join(lines) + "\n"
 
 
 def main():
     """
     Main execution function for governance validation
     """
-    import sys
-    
     if len(sys.argv) < 2:
         print("Usage: python rift_governance_validator.py <project_root>")
         sys.exit(1)
@@ -346,24 +743,9 @@ def main():
     try:
         report = validator.generate_governance_report()
         
-        # Output validation report
-        print("\n" + "="*60)
-        print("RIFT GOVERNANCE VALIDATION REPORT")
-        print("="*60)
-        print(f"Project: {report['project_root']}")
-        print(f"Timestamp: {report['timestamp']}")
-        print(f"Overall Status: {report['overall_status']}")
-        
-        # Detailed results
-        for stage_id, results in report['pipeline_validation'].items():
-            print(f"\nStage {stage_id} Results:")
-            for component, result in results.items():
-                print(f"  {component}: {result.value}")
-        
-        if report['custom_stage_validation']:
-            print(f"\nCustom Stage Results:")
-            for stage, result in report['custom_stage_validation'].items():
-                print(f"  {stage}: {result.value}")
+        # Output validation report in a single write
+        sys.stdout.write(format_governance_report(report))
+        sys.stdout.flush()
         
         # Exit with appropriate code
         if report['overall_status'] in ['CRITICAL_FAILURE', 'EXPIRED_GOVERNANCE']:
@@ -12,26 +12,167 @@ Methodology: Waterfall - Systematic, Structured, Documented
 import os
 import sys
 import json
+import hashlib
+import tempfile
 import yaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 import subprocess
 import logging
+import logging.handlers
 import argparse
+import atexit
+import queue
+import re
+import signal
 import stat
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from collections import defaultdict, deque
 
+# orjson is an optional C accelerator for audit log and tree cache serialization
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 # Technical Configuration - OBINexus Integration
 TOOLCHAIN_FLOW = "riftlang.exe → .so.a → rift.exe → gosilang"
 BUILD_STACK = "nlink → polybuild"
 PROJECT_ROOT = Path.cwd()
+RESOLVED_PROJECT_ROOT = Path(os.path.realpath(PROJECT_ROOT))
 TOOLS_DIR = PROJECT_ROOT / "tools" / "ad-hoc"
 TREE_CONFIG = TOOLS_DIR / "tree.yml"
 LOG_DIR = PROJECT_ROOT / "build" / "logs"
 METADATA_DIR = PROJECT_ROOT / "build" / "metadata"
+TREE_CACHE = METADATA_DIR / "tree.cache.json"
+AUDIT_LOG_MAXLEN = 10_000
+AUDIT_LOG_MAX_BYTES = 16 * 1024 * 1024  # audit file is rotated to <name>.1 past this size
+OUTPUT_DRAIN_TIMEOUT = 5  # seconds to wait for output pipes after the script exits
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that batches records into one write per 64 KB or 200 ms"""
+    
+    def __init__(self, filename, flush_bytes: int = 64 * 1024, flush_interval: float = 0.2,
+                 flush_level: int = logging.WARNING, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._buffer: List[str] = []
+        self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+        # Timer so records logged before a long quiet stretch still reach disk
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically,
+                                         name='bootstrap-log-flush', daemon=True)
+        self._flusher.start()
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            message = self.format(record) + self.terminator
+            self._buffer.append(message)
+            self._buffered_bytes += len(message)
+            # Warnings and errors are written immediately so failures are never held back
+            if (record.levelno >= self.flush_level
+                    or self._buffered_bytes >= self.flush_bytes
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._write_buffer()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        self.acquire()
+        try:
+            self._write_buffer()
+        finally:
+            self.release()
+    
+    def close(self):
+        self._stop_flusher.set()
+        self._flusher.join()
+        super().close()
+    
+    def _flush_periodically(self):
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+    
+    def _write_buffer(self):
+        if self._buffer:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(''.join(self._buffer))
+            self.stream.flush()
+            self._buffer.clear()
+            self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+
+class AuditTrail(deque):
+    """Bounded audit record buffer that appends to a JSON Lines file before anything is evicted"""
+    
+    def __init__(self, path: Optional[Path] = None, maxlen: int = AUDIT_LOG_MAXLEN):
+        super().__init__(maxlen=maxlen)
+        self.path = path
+    
+    def append(self, record: Dict[str, Any]):
+        self._spill_if_full()
+        super().append(record)
+    
+    def appendleft(self, record: Dict[str, Any]):
+        self._spill_if_full()
+        super().appendleft(record)
+    
+    def insert(self, index: int, record: Dict[str, Any]):
+        self._spill_if_full()
+        super().insert(index, record)
+    
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+    
+    def extendleft(self, records):
+        for record in records:
+            self.appendleft(record)
+    
+    def __iadd__(self, records):
+        self.extend(records)
+        return self
+    
+    def _spill_if_full(self):
+        if len(self) == self.maxlen and self.path is not None:
+            try:
+                self.flush()
+            except (OSError, TypeError) as e:
+                logging.warning(f"Audit log flush failed: {self.path} - {e}")
+    
+    def flush(self):
+        """Append the retained records to the audit file and release them"""
+        if self.path is None or not self:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if self.path.stat().st_size >= AUDIT_LOG_MAX_BYTES:
+                os.replace(self.path, self.path.with_name(self.path.name + '.1'))
+        except FileNotFoundError:
+            pass
+        with open(self.path, 'ab') as f:
+            f.write(b''.join(_json_dumps(record) + b'\n' for record in self))
+        self.clear()
 
-@dataclass
+@dataclass(slots=True)
 class ScriptMetadata:
     """Technical metadata structure for script lifecycle management"""
     name: str
@@ -48,14 +189,15 @@ class ScriptMetadata:
 class GovernanceValidator:
     """Zero-trust governance validation framework"""
     
-    def __init__(self, policies: Dict[str, Any]):
+    def __init__(self, policies: Dict[str, Any], audit_path: Optional[Path] = None):
         self.policies = policies
-        self.audit_log = []
+        self.audit_log = AuditTrail(audit_path)
     
-    def validate_script_execution(self, script_meta: ScriptMetadata) -> bool:
+    def validate_script_execution(self, script_meta: ScriptMetadata,
+                                  script_stat: Optional[os.stat_result] = None) -> bool:
         """Comprehensive script execution validation"""
         validation_results = {
-            'permission_check': self._validate_permissions(script_meta),
+            'permission_check': self._validate_permissions(script_meta, script_stat),
             'dependency_resolution': self._validate_dependencies(script_meta),
             'governance_compliance': self._validate_governance_policy(script_meta),
             'security_scan': self._validate_security_requirements(script_meta)
@@ -69,13 +211,19 @@ class GovernanceValidator:
         
         return all(validation_results.values())
     
-    def _validate_permissions(self, script_meta: ScriptMetadata) -> bool:
+    def flush_audit(self):
+        """Append audit entries not yet on disk to the audit file"""
+        self.audit_log.flush()
+    
+    def _validate_permissions(self, script_meta: ScriptMetadata,
+                              script_stat: Optional[os.stat_result] = None) -> bool:
         """Validate script permission requirements"""
         try:
-            script_stat = script_meta.path.stat()
-            current_mode = oct(script_stat.st_mode)[-3:]
+            if script_stat is None:
+                script_stat = script_meta.path.stat()
             required_mode = script_meta.permissions
-            return current_mode == required_mode
+            mode = int(required_mode, 8) if isinstance(required_mode, str) else required_mode
+            return (script_stat.st_mode & 0o777) == mode
         except (OSError, ValueError):
             return False
     
@@ -98,7 +246,8 @@ class GovernanceValidator:
         """Validate security requirements for zero-trust execution"""
         # Check if script is within project bounds
         try:
-            script_meta.path.resolve().relative_to(PROJECT_ROOT.resolve())
+            # Resolved here, not at parse time, so a symlink swapped in since parsing is caught
+            Path(os.path.realpath(script_meta.path)).relative_to(RESOLVED_PROJECT_ROOT)
             return True
         except ValueError:
             return False
@@ -116,7 +265,6 @@ class GovernanceValidator:
     
     def _get_timestamp(self) -> str:
         """Generate RFC3339 timestamp for audit logging"""
-        from datetime import datetime
         return datetime.now().isoformat()
 
 class HookExecutor:
@@ -126,18 +274,31 @@ class HookExecutor:
         self.tools_dir = tools_dir
         self.dry_run = dry_run
         self.hook_results = defaultdict(list)
+        # One directory scan per hook type instead of a stat per configured hook
+        self._available = {hook_type: self._scan_hooks(hook_type) for hook_type in ('pre', 'post')}
+    
+    def _scan_hooks(self, hook_type: str) -> set:
+        """Names of the hook scripts present under hooks/<hook_type>"""
+        try:
+            with os.scandir(self.tools_dir / "hooks" / hook_type) as entries:
+                return {entry.name[:-3] for entry in entries if entry.name.endswith('.sh')}
+        except OSError:
+            return set()
     
     def execute_hooks(self, hook_type: str, hooks: List[str], context: Dict[str, Any]) -> bool:
         """Execute specified hooks with context preservation"""
         success = True
         
+        hook_paths = []
         for hook_name in hooks:
             hook_path = self.tools_dir / "hooks" / hook_type / f"{hook_name}.sh"
             
-            if not hook_path.exists():
+            if hook_name not in self._available.get(hook_type, ()):
                 logging.warning(f"Hook script not found: {hook_path}")
                 continue
-            
+            hook_paths.append((hook_name, hook_path))
+        
+        for hook_name, hook_path in hook_paths:
             try:
                 result = self._execute_single_hook(hook_path, context)
                 self.hook_results[hook_type].append({
@@ -164,16 +325,10 @@ class HookExecutor:
         # Set execution permissions
         hook_path.chmod(0o750)
         
-        # Prepare environment with context
-        env = os.environ.copy()
-        env.update({
-            f"HOOK_{k.upper()}": str(v) for k, v in context.items()
-        })
-        
         try:
             result = subprocess.run(
                 [str(hook_path)],
-                env=env,
+                env=self._hook_environment(context),
                 capture_output=True,
                 text=True,
                 timeout=300  # 5-minute timeout for hooks
@@ -192,32 +347,55 @@ class HookExecutor:
         except Exception as e:
             logging.error(f"Hook execution error: {hook_path} - {e}")
             return False
+    
+    def _hook_environment(self, context: Dict[str, Any]) -> Dict[str, str]:
+        """Prepare environment with context"""
+        env = os.environ.copy()
+        env.update({
+            f"HOOK_{k.upper()}": str(v) for k, v in context.items()
+        })
+        return env
 
 class PermissionElevator:
     """Permission elevation management system"""
     
-    def __init__(self, permission_config: Dict[str, Any]):
+    def __init__(self, permission_config: Dict[str, Any], paranoid: bool = False,
+                 audit_path: Optional[Path] = None):
         self.config = permission_config
-        self.elevation_log = []
+        self.paranoid = paranoid
+        self.elevation_log = AuditTrail(audit_path)
+        self._rules = [
+            (self._compile_pattern(rule.get('pattern', '')), rule.get('mode', '0755'))
+            for rule in permission_config.get('elevation_rules', [])
+        ]
     
-    def elevate_permissions(self, script_path: Path, required_mode: str) -> bool:
+    def elevate_permissions(self, script_path: Path, required_mode: str,
+                            current_stat: Optional[os.stat_result] = None) -> bool:
         """Systematic permission elevation with audit logging"""
         try:
             # Convert permission string to octal
             mode = int(required_mode, 8) if isinstance(required_mode, str) else required_mode
             
-            # Apply permissions
-            script_path.chmod(mode)
-            
-            # Verify elevation
-            current_stat = script_path.stat()
-            current_mode = oct(current_stat.st_mode)[-3:]
+            if current_stat is not None and (current_stat.st_mode & 0o777) == mode:
+                # Already at the required mode; nothing to apply
+                action = 'noop'
+                current_mode = mode
+            else:
+                # Apply permissions
+                action = 'chmod'
+                script_path.chmod(mode)
+                current_mode = mode
+                
+                # Verify elevation only when explicitly requested
+                if self.paranoid:
+                    current_mode = script_path.stat().st_mode & 0o777
             
             elevation_record = {
                 'path': str(script_path),
+                'action': action,
                 'required_mode': required_mode,
-                'applied_mode': current_mode,
-                'success': current_mode == required_mode,
+                'applied_mode': f"{current_mode:03o}",
+                'success': current_mode == mode,
                 'timestamp': self._get_timestamp()
             }
             
@@ -228,35 +406,29 @@ class PermissionElevator:
             logging.error(f"Permission elevation failed: {script_path} - {e}")
             return False
     
+    def flush_audit(self):
+        """Append elevation records not yet on disk to the audit file"""
+        self.elevation_log.flush()
+    
     def validate_permission_policy(self, script_path: Path) -> str:
         """Determine required permissions based on policy configuration"""
-        for rule in self.config.get('elevation_rules', []):
-            pattern = rule.get('pattern', '')
-            
-            # Simple pattern matching (can be enhanced with glob/regex)
-            if self._matches_pattern(script_path, pattern):
-                return rule.get('mode', '0755')
+        path_str = str(script_path)
+        for pattern, mode in self._rules:
+            if pattern.fullmatch(path_str):
+                return mode
         
         return self.config.get('default_script_mode', '0755')
     
-    def _matches_pattern(self, path: Path, pattern: str) -> bool:
-        """Pattern matching for permission rules"""
-        # Simplified pattern matching - can be enhanced
-        pattern_parts = pattern.split('/')
-        path_parts = str(path).split('/')
-        
-        if len(pattern_parts) != len(path_parts):
-            return False
-        
-        for pattern_part, path_part in zip(pattern_parts, path_parts):
-            if pattern_part != '*' and pattern_part != path_part:
-                return False
-        
-        return True
+    @staticmethod
+    def _compile_pattern(pattern: str) -> re.Pattern:
+        """Compile a permission rule where a '*' segment matches any single path segment"""
+        return re.compile('/'.join(
+            '[^/]*' if part == '*' else re.escape(part)
+            for part in pattern.split('/')
+        ))
     
     def _get_timestamp(self) -> str:
         """Generate timestamp for audit logging"""
-        from datetime import datetime
         return datetime.now().isoformat()
 
 class TreeResolver:
@@ -265,17 +437,21 @@ class TreeResolver:
     def __init__(self, tree_config: Dict[str, Any]):
         self.config = tree_config
         self.scripts = {}
-        self.dependency_graph = defaultdict(list)
+        self.dependency_graph: Dict[str, List[str]] = {}
+        self.in_degree: Dict[str, int] = {}
+        self._order_cache: Dict[str, List[ScriptMetadata]] = {}
         self._parse_configuration()
     
     def _parse_configuration(self):
         """Parse tree configuration into internal structures"""
         scripts_config = self.config.get('scripts', {})
+        self._order_cache.clear()
         
         for script_name, script_config in scripts_config.items():
+            script_path = TOOLS_DIR / script_config['path']
             self.scripts[script_name] = ScriptMetadata(
                 name=script_name,
-                path=TOOLS_DIR / script_config['path'],
+                path=script_path,
                 stage=script_config.get('stage', 0),
                 depends_on=script_config.get('depends_on', []),
                 permissions=script_config.get('permissions', '0755'),
@@ -285,38 +461,64 @@ class TreeResolver:
                 compilation=script_config.get('compilation'),
                 wasm=script_config.get('wasm')
             )
-            
-            # Build dependency graph
-            for dependency in script_config.get('depends_on', []):
-                self.dependency_graph[dependency].append(script_name)
+        
+        # Build dependency graph: count dependents first so each list is allocated once
+        dependent_counts: Dict[str, int] = {}
+        for metadata in self.scripts.values():
+            for dependency in metadata.depends_on:
+                dependent_counts[dependency] = dependent_counts.get(dependency, 0) + 1
+        
+        self.dependency_graph = {dependency: [None] * count for dependency, count in dependent_counts.items()}
+        fill_index = dict.fromkeys(dependent_counts, 0)
+        for script_name, metadata in self.scripts.items():
+            for dependency in metadata.depends_on:
+                self.dependency_graph[dependency][fill_index[dependency]] = script_name
+                fill_index[dependency] += 1
+        
+        # Unknown dependencies never run, so they do not hold back their dependents
+        self.in_degree = {
+            script_name: sum(1 for dependency in metadata.depends_on if dependency in self.scripts)
+            for script_name, metadata in self.scripts.items()
+        }
     
     def resolve_execution_order(self, target_script: str) -> List[ScriptMetadata]:
         """Topological sort for dependency resolution"""
-        visited = set()
-        temp_visited = set()
+        if target_script not in self._order_cache:
+            self._order_cache[target_script] = self._topological_order(target_script)
+        return list(self._order_cache[target_script])
+    
+    def _topological_order(self, target_script: str) -> List[ScriptMetadata]:
+        """Kahn's algorithm over the scripts reachable from the target"""
+        if target_script not in self.scripts:
+            return []
+        
+        # Collect the target and everything it transitively depends on
+        reachable = {target_script: None}
+        frontier = deque([target_script])
+        while frontier:
+            for dependency in self.scripts[frontier.popleft()].depends_on:
+                if dependency in self.scripts and dependency not in reachable:
+                    reachable[dependency] = None
+                    frontier.append(dependency)
+        
+        # Every dependency of a reachable script is itself reachable, so global in-degrees apply
+        remaining = {script_name: self.in_degree[script_name] for script_name in reachable}
+        ready = deque(script_name for script_name, degree in remaining.items() if degree == 0)
         execution_order = []
         
-        def dfs(script_name: str):
-            if script_name in temp_visited:
-                raise ValueError(f"Circular dependency detected involving: {script_name}")
-            
-            if script_name in visited:
-                return
-            
-            temp_visited.add(script_name)
-            
-            # Visit dependencies first
-            if script_name in self.scripts:
-                for dependency in self.scripts[script_name].depends_on:
-                    dfs(dependency)
-            
-            temp_visited.remove(script_name)
-            visited.add(script_name)
-            
-            if script_name in self.scripts:
-                execution_order.append(self.scripts[script_name])
+        while ready:
+            script_name = ready.popleft()
+            execution_order.append(self.scripts[script_name])
+            for dependent in self.dependency_graph.get(script_name, ()):
+                if dependent in remaining:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        ready.append(dependent)
+        
+        if len(execution_order) < len(reachable):
+            blocked = sorted(name for name, degree in remaining.items() if degree > 0)
+            raise ValueError(f"Circular dependency detected involving: {', '.join(blocked)}")
         
-        dfs(target_script)
         return execution_order
     
     def get_script_metadata(self, script_name: str) -> Optional[ScriptMetadata]:
@@ -326,10 +528,12 @@ class TreeResolver:
 class RiftBridgeBootstrapper:
     """Main orchestrator for RIFT-Bridge bootstrap process"""
     
-    def __init__(self, config_path: Path, dry_run: bool = False, verbose: bool = False):
+    def __init__(self, config_path: Path, dry_run: bool = False, verbose: bool = False,
+                 paranoid: bool = False):
         self.config_path = config_path
         self.dry_run = dry_run
         self.verbose = verbose
+        self.paranoid = paranoid
         
         # Initialize logging
         self._setup_logging()
@@ -339,9 +543,11 @@ class RiftBridgeBootstrapper:
         
         # Initialize components
         self.tree_resolver = TreeResolver(self.config)
-        self.governance_validator = GovernanceValidator(self.config.get('governance', {}))
+        self.governance_validator = GovernanceValidator(self.config.get('governance', {}),
+                                                        METADATA_DIR / 'governance_audit.jsonl')
         self.hook_executor = HookExecutor(TOOLS_DIR, dry_run)
-        self.permission_elevator = PermissionElevator(self.config.get('permissions', {}))
+        self.permission_elevator = PermissionElevator(self.config.get('permissions', {}), paranoid,
+                                                      METADATA_DIR / 'elevation_audit.jsonl')
         
     def _setup_logging(self):
         """Configure comprehensive logging for bootstrap process"""
@@ -350,20 +556,45 @@ class RiftBridgeBootstrapper:
         # Ensure log directory exists
         LOG_DIR.mkdir(parents=True, exist_ok=True)
         
+        # File output is buffered and written from a listener thread, off the orchestrator path
+        file_handler = BufferedFileHandler(LOG_DIR / 'bootstrap.log')
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        # Full formatting happens once, in the file handler
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._log_listener.start()
+        atexit.register(self._stop_logging, file_handler)
+        
         logging.basicConfig(
             level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            format=LOG_FORMAT,
             handlers=[
-                logging.FileHandler(LOG_DIR / 'bootstrap.log'),
+                queue_handler,
                 logging.StreamHandler(sys.stdout)
             ]
         )
     
+    def _stop_logging(self, file_handler: logging.Handler):
+        """Drain queued log records and flush the buffered log file"""
+        self._log_listener.stop()
+        file_handler.close()
+    
     def _load_configuration(self) -> Dict[str, Any]:
         """Load and validate tree configuration"""
+        logging.debug(f"YAML loader: {_YamlLoader.__name__}")
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            with open(self.config_path, 'rb') as f:
+                source_stat = os.fstat(f.fileno())
+                raw = f.read()
+            
+            # Parsed tree is reused while the source file is unchanged
+            cache_key = (source_stat.st_mtime_ns, source_stat.st_size, hashlib.sha256(raw).hexdigest())
+            config = self._read_config_cache(cache_key)
+            if config is None:
+                config = yaml.load(raw, Loader=_YamlLoader)
+                self._write_config_cache(cache_key, config)
             
             # Validate configuration structure
             required_sections = ['metadata', 'scripts', 'hooks', 'permissions', 'governance']
@@ -377,6 +608,39 @@ class RiftBridgeBootstrapper:
             logging.error(f"Configuration loading failed: {e}")
             sys.exit(1)
     
+    def _read_config_cache(self, cache_key: tuple) -> Optional[Dict[str, Any]]:
+        """Return the cached configuration if it was parsed from the same source"""
+        try:
+            with open(TREE_CACHE, 'rb') as f:
+                cached = _json_loads(f.read())
+            if cached['key'] == list(cache_key) and isinstance(cached['config'], dict):
+                return cached['config']
+        except Exception:
+            # Any unreadable or malformed cache just means a normal parse
+            pass
+        return None
+    
+    def _write_config_cache(self, cache_key: tuple, config: Dict[str, Any]):
+        """Atomically persist the parsed configuration alongside its source key"""
+        cached = {'key': list(cache_key), 'config': config}
+        try:
+            payload = _json_dumps(cached)
+            # YAML values without an exact JSON form (dates, non-string keys) are not cached
+            if _json_loads(payload) != cached:
+                logging.debug("Configuration cache not written: tree is not JSON round-trippable")
+                return
+            METADATA_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=METADATA_DIR, prefix=TREE_CACHE.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, TREE_CACHE)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logging.debug(f"Configuration cache not written: {e}")
+    
     def bootstrap_target(self, target_script: str) -> bool:
         """Execute complete bootstrap process for target script"""
         logging.info(f"Starting bootstrap process for target: {target_script}")
@@ -400,19 +664,37 @@ class RiftBridgeBootstrapper:
         except Exception as e:
             logging.error(f"Bootstrap process failed: {e}")
             return False
+        
+        finally:
+            self._flush_audit_logs()
+    
+    def _flush_audit_logs(self):
+        """Persist governance and elevation audit trails under build/metadata"""
+        try:
+            self.governance_validator.flush_audit()
+            self.permission_elevator.flush_audit()
+        except (OSError, TypeError) as e:
+            logging.warning(f"Audit log flush failed: {e}")
     
     def _execute_script_with_lifecycle(self, script_meta: ScriptMetadata) -> bool:
         """Execute script with complete lifecycle management"""
         logging.info(f"Executing script: {script_meta.name} (Stage {script_meta.stage})")
         
+        script_stat = self._snapshot_stat(script_meta.path)
+        
         # 1. Permission elevation
         required_mode = self.permission_elevator.validate_permission_policy(script_meta.path)
-        if not self.permission_elevator.elevate_permissions(script_meta.path, required_mode):
+        if not self.permission_elevator.elevate_permissions(script_meta.path, required_mode, script_stat):
             logging.error(f"Permission elevation failed: {script_meta.name}")
             return False
         
+        # Only a chmod that actually changed the mode invalidates the snapshot
+        mode = int(required_mode, 8) if isinstance(required_mode, str) else required_mode
+        if script_stat is None or (script_stat.st_mode & 0o777) != mode:
+            script_stat = self._snapshot_stat(script_meta.path)
+        
         # 2. Governance validation
-        if not self.governance_validator.validate_script_execution(script_meta):
+        if not self.governance_validator.validate_script_execution(script_meta, script_stat):
             logging.error(f"Governance validation failed: {script_meta.name}")
             return False
         
@@ -444,6 +726,13 @@ class RiftBridgeBootstrapper:
         logging.info(f"Script execution completed: {script_meta.name}")
         return True
     
+    def _snapshot_stat(self, path: Path) -> Optional[os.stat_result]:
+        """Single stat of a script, shared by the lifecycle validators"""
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+    
     def _execute_main_script(self, script_meta: ScriptMetadata, context: Dict[str, Any]) -> bool:
         """Execute main script with comprehensive error handling"""
         if self.dry_run:
@@ -461,21 +750,46 @@ class RiftBridgeBootstrapper:
                 'RIFT_PROJECT_ROOT': str(PROJECT_ROOT)
             })
             
-            result = subprocess.run(
+            process = subprocess.Popen(
                 [str(script_meta.path)],
                 env=env,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=1,
                 text=True,
-                timeout=1800  # 30-minute timeout
+                errors='replace',  # Undecodable output must not stop the forwarders draining the pipes
+                start_new_session=True  # Own process group, so a timeout also kills its children
             )
             
-            # Log execution results
-            if result.stdout:
-                logging.debug(f"Script output: {result.stdout}")
-            if result.stderr:
-                logging.warning(f"Script stderr: {result.stderr}")
+            # Stream stdout to the log as it is produced; stderr is collected and
+            # logged as one warning so it does not force a file flush per line
+            stderr_lines: List[str] = []
+            forwarders = [
+                threading.Thread(target=self._forward_output,
+                                 args=(process.stdout,
+                                       lambda line: logging.debug(f"Script output: {line.rstrip()}")),
+                                 daemon=True),
+                threading.Thread(target=self._forward_output,
+                                 args=(process.stderr, stderr_lines.append), daemon=True)
+            ]
+            for forwarder in forwarders:
+                forwarder.start()
             
-            return result.returncode == 0
+            try:
+                returncode = process.wait(timeout=1800)  # 30-minute timeout
+            except (subprocess.TimeoutExpired, KeyboardInterrupt):
+                os.killpg(process.pid, signal.SIGKILL)
+                process.wait()
+                raise
+            finally:
+                # A detached grandchild may still hold the pipes open; don't wait on it
+                drain_deadline = time.monotonic() + OUTPUT_DRAIN_TIMEOUT
+                for forwarder in forwarders:
+                    forwarder.join(timeout=max(0.0, drain_deadline - time.monotonic()))
+                if stderr_lines:
+                    logging.warning(f"Script stderr: {''.join(stderr_lines)}")
+            
+            return returncode == 0
             
         except subprocess.TimeoutExpired:
             logging.error(f"Script timeout: {script_meta.path}")
@@ -483,6 +797,13 @@ class RiftBridgeBootstrapper:
         except Exception as e:
             logging.error(f"Script execution error: {script_meta.path} - {e}")
             return False
+    
+    @staticmethod
+    def _forward_output(stream, sink):
+        """Pass each line of a child output stream to sink until the stream closes"""
+        with stream:
+            for line in stream:
+                sink(line)
 
 def main():
     """Main entry point for RIFT-Bridge bootstrap orchestrator"""
@@ -508,6 +829,11 @@ def main():
         action='store_true',
         help='Enable verbose logging'
     )
+    parser.add_argument(
+        '--paranoid',
+        action='store_true',
+        help='Re-stat scripts after chmod to verify permission elevation'
+    )
     
     args = parser.parse_args()
     
@@ -515,7 +841,8 @@ def main():
     bootstrapper = RiftBridgeBootstrapper(
         config_path=Path(args.config),
         dry_run=args.dry_run,
-        verbose=args.verbose
+        verbose=args.verbose,
+        paranoid=args.paranoid
     )
     
     # Execute bootstrap process
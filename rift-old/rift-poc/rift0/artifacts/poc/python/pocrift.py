@@ -1,6 +1,12 @@
 from dataclasses import dataclass
+from functools import lru_cache
 import re
-from typing import Dict, Set, Optional, List
+import sys
+from typing import Dict, Set, Optional, List, Tuple
+
+# Backreferences, conditionals and global inline flags change meaning (or fail to compile)
+# once a pattern is embedded in a larger alternation
+_ALTERNATION_UNSAFE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
 
 @dataclass(frozen=True)
 class State:
@@ -16,14 +22,30 @@ class RegexAutomaton:
     
     def __init__(self):
         self.states: Set[State] = set()
-        self.transitions: Dict[tuple[State, str], State] = {}
+        # Keyed by the source state's (interned pattern, is_final) identity rather than by
+        # State to avoid dataclass hashing; a final and a non-final state never share edges
+        self.transitions: Dict[Tuple[str, bool, str], State] = {}
         self.initial_state: Optional[State] = None
         self.current_state: Optional[State] = None
+        # Insertion-ordered states and their combined alternation, rebuilt lazily
+        self._ordered_states: List[State] = []
+        self._state_index: Dict[Tuple[str, bool], State] = {}
+        self._alt_re: Optional[re.Pattern] = None
+        self._alt_built = False
+        # Token text -> matching state; tokens recur heavily in real source
+        self._classify = lru_cache(maxsize=4096)(self._match_state)
         
     def add_state(self, pattern: str, is_final: bool = False) -> State:
         """Add a new regex state to the automaton."""
-        state = State(pattern, is_final)
-        self.states.add(state)
+        key = (sys.intern(pattern), is_final)
+        state = self._state_index.get(key)
+        if state is None:
+            state = State(*key)
+            self._state_index[key] = state
+            self.states.add(state)
+            self._ordered_states.append(state)
+            self._alt_built = False
+            self._classify.cache_clear()
         if not self.initial_state:
             self.initial_state = state
             self.current_state = state
@@ -31,25 +53,53 @@ class RegexAutomaton:
         
     def add_transition(self, from_state: State, input_pattern: str, to_state: State):
         """Add a transition between states."""
-        self.transitions[(from_state, input_pattern)] = to_state
+        self.transitions[(sys.intern(from_state.pattern), from_state.is_final, input_pattern)] = to_state
     
     def get_next_state(self, input_text: str) -> Optional[State]:
         """Find next valid state for given input."""
         if not self.current_state:
             return None
             
-        # Try to match the current input directly
-        for state in self.states:
-            if state.matches(input_text):
-                self.current_state = state
-                return state
-        return None
+        state = self._classify(input_text)
+        if state is not None:
+            self.current_state = state
+        return state
+    
+    def _match_state(self, input_text: str) -> Optional[State]:
+        """Pure lookup of the state matching input; memoized per token text."""
+        if not self._alt_built:
+            self._alt_re = self._compile_alternation()
+            self._alt_built = True
+        
+        if self._alt_re is None:
+            # Patterns that cannot share an alternation are tried one by one
+            for state in self._ordered_states:
+                if state.matches(input_text):
+                    return state
+            return None
+        
+        # Match every state pattern in one pass; lastgroup names the winner
+        match = self._alt_re.match(input_text)
+        if match is None:
+            return None
+        return self._ordered_states[int(match.lastgroup[1:])]
+
+    def _compile_alternation(self) -> Optional[re.Pattern]:
+        """Combined pattern over all states, or None when the states must be matched separately."""
+        if any(_ALTERNATION_UNSAFE.search(state.pattern) for state in self._ordered_states):
+            return None
+        try:
+            return re.compile("|".join(
+                f"(?P<s{i}>{state.pattern})" for i, state in enumerate(self._ordered_states)
+            ))
+        except re.error:
+            return None
 
 class IRNode:
     """Base class for IR nodes."""
-    pass
+    __slots__ = ()
 
-@dataclass
+@dataclass(slots=True)
 class TokenNode(IRNode):
     """IR node representing a token."""
     type: str
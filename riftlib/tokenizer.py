@@ -6,13 +6,11 @@ strings into a sequence of tokens. The rules are taken from the language
 specification and use Python regular expressions for matching.
 """
 
-from dataclasses import dataclass
 import re
-from typing import List, Tuple
+from typing import List, NamedTuple, Tuple
 
 
-@dataclass
-class Token:
+class Token(NamedTuple):
     """Simple token data structure."""
 
     type: str
@@ -21,42 +19,45 @@ class Token:
     end: int
 
 
+# Order matters: governance and memory references should be matched
+# before generic identifiers to avoid premature matches.
+_PATTERNS = [
+    ("GOVERNANCE", r"governance\s*\{[^{}]*\}"),
+    ("MEMORY_REF", r"@[a-zA-Z_][a-zA-Z0-9_]*"),
+    ("FUNC_SIG", r"\w+\s*\([^)]*\)"),
+    ("EXPR_BLOCK", r"\{[^{}]*\}"),
+    # Unrolled loop: linear-time match even on unterminated strings.
+    ("STRING", r'"[^"\\]*(?:\\.[^"\\]*)*"'),
+    ("NUMBER", r"\d+(\.\d+)?([eE][+-]?\d+)?"),
+    ("IDENTIFIER", r"[a-zA-Z_][a-zA-Z0-9_]*"),
+    # Catch-all so unknown characters are skipped inside the regex engine.
+    ("SKIP", r"."),
+]
+
+# Compiled once at import and shared by every Tokenizer instance.
+_TOKEN_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _PATTERNS)
+)
+
+
 class Tokenizer:
-    """Compile regular expressions and tokenize RIFT source code."""
+    """Tokenize RIFT source code using the shared compiled expression."""
 
     def __init__(self) -> None:
-        # Order matters: governance and memory references should be matched
-        # before generic identifiers to avoid premature matches.
-        patterns = [
-            ("GOVERNANCE", r"governance\s*\{[^}]*\}"),
-            ("MEMORY_REF", r"@[a-zA-Z_][a-zA-Z0-9_]*"),
-            ("FUNC_SIG", r"\w+\s*\([^)]*\)"),
-            ("EXPR_BLOCK", r"\{[^}]*\}"),
-            ("STRING", r"\"([^\"\\]|\\.)*\""),
-            ("NUMBER", r"\d+(\.\d+)?([eE][+-]?\d+)?"),
-            ("IDENTIFIER", r"[a-zA-Z_][a-zA-Z0-9_]*"),
-        ]
-        self.regex = re.compile(
-            "|".join(f"(?P<{name}>{pattern})" for name, pattern in patterns)
-        )
+        self.regex = _TOKEN_RE
 
     def tokenize(self, text: str) -> List[Token]:
-        tokens: List[Token] = []
-        pos = 0
-        while pos < len(text):
-            match = self.regex.match(text, pos)
-            if not match:
-                # Skip unknown character
-                pos += 1
-                continue
-            typ = match.lastgroup
-            value = match.group(typ)
-            tokens.append(Token(typ, value, match.start(), match.end()))
-            pos = match.end()
-        return tokens
+        return [
+            Token(match.lastgroup, match.group(), *match.span())
+            for match in self.regex.finditer(text)
+            if match.lastgroup != "SKIP"
+        ]
+
+
+_DEFAULT_TOKENIZER = Tokenizer()
 
 
 def tokenize(text: str) -> List[Token]:
     """Tokenize a text string using the default tokenizer."""
 
-    return Tokenizer().tokenize(text)
+    return _DEFAULT_TOKENIZER.tokenize(text)
@@ -0,0 +1,99 @@
+import asyncio
+import datetime
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "poc"))
+
+from rift_governance_validator import RIFTGovernanceValidator, ValidationResult
+
+
+class GovernanceValidatorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = self.tmp.name
+
+    def write_config(self, name, **fields):
+        config = {
+            "package_name": "rift-test",
+            "version": "1.0.0",
+            "stage": 0,
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }
+        config.update(fields)
+        with open(os.path.join(self.root, name), "w") as f:
+            json.dump(config, f)
+
+    def test_missing_substage_requires_explicit_experimental(self):
+        validator = RIFTGovernanceValidator(self.root)
+        self.write_config(".riftrc.0")
+        results = validator.validate_stage_governance(0)
+        self.assertEqual(results["tokenizer_fallback"], ValidationResult.MISSING_GOVERNANCE)
+
+        self.write_config(".riftrc.0", stage_type="experimental")
+        results = validator.validate_stage_governance(0)
+        self.assertEqual(results["tokenizer_fallback"], ValidationResult.VALID)
+
+    def test_malformed_parse_cache_entries_are_ignored(self):
+        self.write_config(".riftrc.0", stage_type="experimental")
+        riftrc = os.path.abspath(os.path.join(self.root, ".riftrc.0"))
+        with open(os.path.join(self.root, ".riftrc.cache.json"), "w") as f:
+            json.dump({riftrc: 1, "other": ["x"]}, f)
+        results = RIFTGovernanceValidator(self.root).validate_stage_governance(0)
+        self.assertEqual(results["stage_0_primary"], ValidationResult.VALID)
+
+    def test_custom_stages_read_from_bare_riftrc(self):
+        with open(os.path.join(self.root, ".riftrc"), "w") as f:
+            json.dump({"custom_stages": [{"name": "chaos", "stage_id": 7, "activated": True}]}, f)
+        report = RIFTGovernanceValidator(self.root).generate_governance_report()
+        self.assertEqual(report["custom_stage_validation"], {"custom_chaos": ValidationResult.MISSING_GOVERNANCE})
+
+    def test_repeated_calls_see_directory_changes(self):
+        validator = RIFTGovernanceValidator(self.root)
+        self.write_config(".riftrc.0")
+        self.assertIn("stage_0_primary", validator.validate_stage_governance(0))
+
+        os.remove(os.path.join(self.root, ".riftrc.0"))
+        self.assertNotIn("stage_0_primary", validator.validate_stage_governance(0))
+
+    def test_report_fingerprints_governance_files(self):
+        self.write_config(".riftrc.0", stage_type="experimental")
+        with open(os.path.join(self.root, ".riftrc.0"), "rb") as f:
+            expected = hashlib.sha256(f.read()).hexdigest()
+        for _ in range(2):  # second report is served from the persisted parse cache
+            report = RIFTGovernanceValidator(self.root).generate_governance_report()
+            self.assertEqual(report["audit_fingerprints"],
+                             {os.path.abspath(os.path.join(self.root, ".riftrc.0")): expected})
+
+    def test_semverx_check_inside_running_event_loop(self):
+        self.write_config(".riftrc.0", semverx_lock=True, nlink_enabled=True)
+        validator = RIFTGovernanceValidator(self.root)
+
+        async def validate():
+            return validator.validate_governance_file(os.path.join(self.root, ".riftrc.0"))
+
+        with mock.patch.dict(os.environ, {"PATH": self.root}):  # no nlink available
+            result, _ = asyncio.run(validate())
+        self.assertEqual(result, ValidationResult.SEMVERX_VIOLATION)
+
+    def test_timestamp_freshness_window(self):
+        validator = RIFTGovernanceValidator(self.root)
+        now = datetime.datetime(2025, 6, 1, tzinfo=datetime.timezone.utc)
+        cases = [
+            (now + datetime.timedelta(seconds=1), False),
+            (now - datetime.timedelta(days=90) + datetime.timedelta(seconds=1), True),
+            (now - datetime.timedelta(days=90) - datetime.timedelta(seconds=1), False),
+        ]
+        for timestamp, fresh in cases:
+            with self.subTest(timestamp=timestamp):
+                self.assertEqual(validator._validate_timestamp_freshness(timestamp.isoformat(), now), fresh)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,12 +10,24 @@ class TokenizerTest(unittest.TestCase):
             '@memory1\n'
             '"hello" 123'
         )
+        types = {t.type for t in tokenize(source)}
+        for expected in ('GOVERNANCE', 'FUNC_SIG', 'MEMORY_REF', 'STRING', 'NUMBER'):
+            self.assertIn(expected, types)
+
+    def test_long_escaped_string(self):
+        source = '"' + 'a\\"' * 3000 + '"'
         tokens = tokenize(source)
-        self.assertTrue(any(t.type == 'GOVERNANCE' for t in tokens))
-        self.assertTrue(any(t.type == 'FUNC_SIG' for t in tokens))
-        self.assertTrue(any(t.type == 'MEMORY_REF' for t in tokens))
-        self.assertTrue(any(t.type == 'STRING' for t in tokens))
-        self.assertTrue(any(t.type == 'NUMBER' for t in tokens))
+        self.assertEqual([(t.type, t.value) for t in tokens], [('STRING', source)])
+
+    def test_unterminated_string(self):
+        tokens = tokenize('"' + 'a' * 10000)
+        self.assertEqual([t.type for t in tokens], ['IDENTIFIER'])
+        self.assertEqual(tokens[0].start, 1)
+
+    def test_nested_braces_do_not_overrun(self):
+        tokens = tokenize('governance { stage { 0 } }')
+        self.assertNotIn('GOVERNANCE', [t.type for t in tokens])
+        self.assertIn(('EXPR_BLOCK', '{ 0 }'), [(t.type, t.value) for t in tokens])
 
 
 if __name__ == '__main__':